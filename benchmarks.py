@@ -4,6 +4,7 @@ Performance benchmarks for the noexcept package.
 """
 
 import time
+import itertools
 import threading
 from multiprocessing import Process, Queue
 from typing import List
@@ -15,6 +16,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from noexcept import no
 
+# Registration benchmarks draw a fresh block of 100 never-registered codes per
+# iteration, so every call takes the lock and writes to the registry. Writes
+# scale with the shared registry's size, so keep the iteration count small.
+_freshCodeBlocks = itertools.count(100000, 100)
+
 def timeit(func, iterations: int = 1000):
     """Time a function execution"""
     start = time.perf_counter()
@@ -26,13 +32,24 @@ def timeit(func, iterations: int = 1000):
 def benchmark_code_registration():
     """Benchmark registering error codes"""
     def register_codes():
+        base = next(_freshCodeBlocks)
         for i in range(100):
-            no.likey(1000 + i, f"Test error {i}")
+            no.likey(base + i, f"Test error {i}")
     
     no.dice()  # Clear state
-    avg_time = timeit(register_codes, 100)
+    avg_time = timeit(register_codes, 10)
     print(f"Code registration: {avg_time:.4f} ms per 100 codes")
 
+def benchmark_bulk_code_registration():
+    """Benchmark registering error codes in bulk"""
+    def register_codes():
+        base = next(_freshCodeBlocks)
+        no.likeyMany((base + i, f"Test error {i}") for i in range(100))
+    
+    no.dice()  # Clear state
+    avg_time = timeit(register_codes, 10)
+    print(f"Bulk code registration: {avg_time:.4f} ms per 100 codes")
+
 def benchmark_simple_exception_raising():
     """Benchmark raising simple exceptions"""
     no.likey(2000, "Benchmark error")
@@ -164,6 +181,7 @@ def run_all_benchmarks():
     print("=" * 40)
     
     benchmark_code_registration()
+    benchmark_bulk_code_registration()
     benchmark_simple_exception_raising()
     benchmark_soft_exceptions()
     benchmark_exception_linking()
@@ -1,4 +1,3 @@
-import inspect
 import sys
 if sys.version_info >= (3, 11):
     # native PEP 654 support
@@ -6,60 +5,65 @@ if sys.version_info >= (3, 11):
 else:
     # backport installed via your env‑marker dependency
     from exceptiongroup import ExceptionGroup
-from typing import Any, List, Optional, cast, Union, Tuple, Callable
-from .module import no
-from .exception import NoBaseException
-
-def _getPending() -> Optional[NoBaseException]:
-    """Get pending exception from thread-local or global storage"""
-    thread_pending = getattr(no._thread_local, 'pending', None)
-    return thread_pending or no.pending.value
+from typing import Dict, List, NoReturn, Optional, Union, Tuple, Callable, cast
+from .module import no, NoModule, DEFAULT_ENTRY
+from .exception import NoBaseException, _defaultMsg
 
 def _setPending(exc: Optional[NoBaseException]) -> None:
     """Set pending exception to thread-local storage"""
     no._thread_local.pending = exc
 
-def _getRegistryEntry(context: Union['NoModule', NoBaseException], code: int, isModule: bool) -> Tuple[bool, str]:
-    """Get soft flag and default message for a code, caching the registry lookup"""
+def _getRegistryEntry(context: Union['NoModule', NoBaseException], code: int, isModule: bool) -> Tuple[str, str, List[int], bool]:
+    """Look up a code's registry entry once per call, so _makeOne can reuse it"""
     if isModule:
-        registry_entry = context._registry.get(code, (None, f"Error {code}", [], False))
-        return registry_entry[3], registry_entry[1]
+        return cast(NoModule, context)._lookup(code) or DEFAULT_ENTRY
     else:
-        return context._softCodes.get(code, False), f"Error {code}"
+        return ("NoBaseException", _defaultMsg(code), [], cast(NoBaseException, context)._softCodes.get(code, False))
 
 def _handleSoftOrRaise(exc: NoBaseException, softFlag: bool, soften: bool) -> None:
     """Handle soft exceptions or raise immediately"""
     if softFlag or soften:
         _setPending(exc)
         return
-    if no.hideTraceback: 
+    hide = no.hideTraceback
+    if hide:
         raze(exc)
     raise exc
 
 def _handleEmptyCall(context: Union['NoModule', NoBaseException], isModule: bool) -> None:
-    """0) EMPTY CALL: no args, no complaint, no soften"""
-    pending = _getPending()
+    """0) EMPTY CALL: no args"""
+    hide = no.hideTraceback
+    pending = no._currentPending()
     if pending is not None:
-        if no.hideTraceback: raze(pending)
+        if hide: raze(pending)
         raise pending
     
     if isModule:
-        exception = context._makeOne(0, None, [])
-        if no.hideTraceback: raze(exception)
+        exception = cast(NoModule, context)._makeOne(0, None, [])
+        if hide: raze(exception)
         raise exception
     
-    if no.hideTraceback: raze(context)
-    raise context
+    instance = cast(NoBaseException, context)
+    if hide: raze(instance)
+    raise instance
 
 
-def _handleExceptionGroup(context: Union['NoModule', NoBaseException], isModule: bool, codes: List[int], complaint: Optional[str]) -> None:
+def _handleExceptionGroup(
+    context: Union['NoModule', NoBaseException],
+    isModule: bool,
+    codes: List[int],
+    complaint: Optional[str],
+    _EG: type = ExceptionGroup
+) -> None:
     """1) EXCEPTION GROUP: single list-of-codes arg"""
     if isModule:
-        exceptions = [context._makeOne(c, complaint, []) for c in codes]
+        module = cast(NoModule, context)
+        exceptions = [module._makeOne(c, complaint, []) for c in codes]
     else:
-        exceptions = [context.__class__(c, complaint) for c in codes]
+        excType = cast(NoBaseException, context).__class__
+        exceptions = [excType(c, complaint) for c in codes]
         if no.hideTraceback: raze(exceptions[0])
-    raise ExceptionGroup("Multiple errors", exceptions)
+    raise _EG("Multiple errors", exceptions)
 
 
 def _handleSingleCode(
@@ -67,44 +71,31 @@ def _handleSingleCode(
     isModule: bool,
     code: int,
     complaint: Optional[str],
-    soften: bool,
-    exception: Optional[BaseException],
-    traceback: Optional[Any]
+    soften: bool
 ) -> None:
     """3) SINGLE-CODE CALL: no(code)"""
     # Cache registry lookup for this code
-    softFlag, defaultMsg = _getRegistryEntry(context, code, isModule)
+    entry = _getRegistryEntry(context, code, isModule)
+    softFlag, defaultMsg = entry[3], entry[1]
     # 3a) EARLY ACCUMULATION
-    if _getPending() is not None:
-        pending = cast(NoBaseException, _getPending())
+    pending = no._currentPending()
+    if pending is not None:
+        # pending is mutated in place, no need to re-save it
         pending.addCode(code, defaultMsg)
         if complaint:
             pending.addMessage(code, complaint)
         pending._softCodes[code] = softFlag
-        # re-save pending to ensure modifications persist
-        _setPending(pending)
         return
-    # 3b) MODULE-PROPAGATION
-    if isModule and isinstance(exception, NoBaseException):
-        e = exception  # type: NoBaseException
-        context.propagate(e, code)
-        if complaint:
-            e.addMessage(code, complaint)
-        e._softCodes[code] = softFlag
-        _handleSoftOrRaise(e, softFlag, soften)
-    # 3c) INSTANCE-PROPAGATION
-    if not isModule and isinstance(context, NoBaseException):
-        context.addCode(code, defaultMsg)
+    # 3c) INSTANCE-PROPAGATION (only NoBaseException.__call__ passes isModule=False)
+    if not isModule:
+        instance = cast(NoBaseException, context)
+        instance.addCode(code, defaultMsg)
         if complaint:
-            context.addMessage(code, complaint)
-        context._softCodes[code] = softFlag
-        _handleSoftOrRaise(context, softFlag, soften)
+            instance.addMessage(code, complaint)
+        instance._softCodes[code] = softFlag
+        return _handleSoftOrRaise(instance, softFlag, soften)
     # 3d) FRESH NEW EXCEPTION
-    exc = (
-        context._makeOne(code, complaint, [])
-        if isModule
-        else context.__class__(code, complaint)
-    )
+    exc = cast(NoModule, context)._makeOne(code, complaint, [], entry)
     _handleSoftOrRaise(exc, softFlag, soften)
 
 
@@ -114,20 +105,21 @@ def _handleCodeExceptionLink(
     code: int,
     exception: BaseException,
     complaint: Optional[str],
-    soften: bool,
-    traceback: Optional[Any]
+    soften: bool
 ) -> None:
     """4) CODE+EXCEPTION LINK: no(code, exc)"""
     # Cache registry lookup for this code
-    softFlag, defaultMsg = _getRegistryEntry(context, code, isModule)
+    entry = _getRegistryEntry(context, code, isModule)
+    softFlag, defaultMsg = entry[3], entry[1]
 
     if isModule:
-        exc = context._makeOne(code, complaint, [exception])
+        exc = cast(NoModule, context)._makeOne(code, complaint, [exception], entry)
         _handleSoftOrRaise(exc, softFlag, soften)
     else:
-        context.addCode(code, defaultMsg)
-        context._recordLinkedException(exception)
-        _handleSoftOrRaise(context, softFlag, soften)
+        instance = cast(NoBaseException, context)
+        instance.addCode(code, defaultMsg)
+        instance._recordLinkedException(exception)
+        _handleSoftOrRaise(instance, softFlag, soften)
 
 
 def _handleCodeMessage(
@@ -135,50 +127,75 @@ def _handleCodeMessage(
     isModule: bool,
     code: int,
     complaint: str,
-    soften: bool,
-    traceback: Optional[Any]
+    soften: bool
 ) -> None:
     """5) CODE+MESSAGE: no(code, custom_msg)"""
     # Cache registry lookup for this code
-    softFlag, defaultMsg = _getRegistryEntry(context, code, isModule)
-    if _getPending() is not None:
-        pending = cast(NoBaseException, _getPending())
+    entry = _getRegistryEntry(context, code, isModule)
+    softFlag, defaultMsg = entry[3], entry[1]
+    pending = no._currentPending()
+    if pending is not None:
         pending.addCode(code, defaultMsg)
         pending.addMessage(code, complaint)
         pending._softCodes[code] = softFlag
-        # persist updated pending block
-        _setPending(pending)
         return
-    if not isModule and isinstance(context, NoBaseException):
-        context.addCode(code, defaultMsg)
-        context.addMessage(code, complaint)
-        context._softCodes[code] = softFlag
-        _handleSoftOrRaise(context, softFlag, soften)
-    exc = (
-        context._makeOne(code, complaint, [])
-        if isModule
-        else context.__class__(code, complaint)
-    )
+    if not isModule:
+        instance = cast(NoBaseException, context)
+        instance.addCode(code, defaultMsg)
+        instance.addMessage(code, complaint)
+        instance._softCodes[code] = softFlag
+        return _handleSoftOrRaise(instance, softFlag, soften)
+    exc = cast(NoModule, context)._makeOne(code, complaint, [], entry)
     _handleSoftOrRaise(exc, softFlag, soften)
 
 
-CallHandler = Callable[[Union['NoModule', NoBaseException], bool, ...], None]
-
-# Strategy pattern: map argument patterns to handler functions
-CALL_HANDLERS: List[Tuple[Callable[[Tuple[Any, ...]], bool], CallHandler]] = [
-    # Pattern checker, handler function
-    (lambda args: not args, lambda ctx, is_mod, *args, **kwargs: _handleEmptyCall(ctx, is_mod)),
-    (lambda args: len(args) == 1 and isinstance(args[0], list), 
-     lambda ctx, is_mod, *args, **kwargs: _handleExceptionGroup(ctx, is_mod, args[0], kwargs.get('complaint'))),
-    (lambda args: len(args) == 1 and isinstance(args[0], BaseException), 
-     lambda ctx, is_mod, *args, **kwargs: None),  # noop
-    (lambda args: len(args) == 1 and isinstance(args[0], int), 
-     lambda ctx, is_mod, *args, **kwargs: _handleSingleCode(ctx, is_mod, args[0], kwargs.get('complaint'), kwargs.get('soften', False), None, None)),
-    (lambda args: len(args) == 2 and isinstance(args[0], int) and isinstance(args[1], BaseException), 
-     lambda ctx, is_mod, *args, **kwargs: _handleCodeExceptionLink(ctx, is_mod, args[0], args[1], kwargs.get('complaint'), kwargs.get('soften', False), None)),
-    (lambda args: len(args) == 2 and isinstance(args[0], int) and isinstance(args[1], str), 
-     lambda ctx, is_mod, *args, **kwargs: _handleCodeMessage(ctx, is_mod, args[0], args[1], kwargs.get('soften', False), None)),
-]
+def _handleRawException(
+    context: Union['NoModule', NoBaseException],
+    isModule: bool,
+    exception: BaseException
+) -> None:
+    """2) RAW EXCEPTION: no(exc) is a noop"""
+    return None
+
+
+_VALID_PATTERNS_MSG = "Valid patterns:\n" + "\n".join(f"  - {pattern}" for pattern in (
+    "no() - empty call to raise pending exception",
+    "no(code: int) - raise exception with error code",
+    "no([code1, code2, ...]) - raise ExceptionGroup with multiple codes",
+    "no(code: int, complaint: str) - raise with custom message",
+    "no(code: int, exception: BaseException) - link existing exception",
+    "no(exception: BaseException) - noop for raw exceptions",
+))
+
+# Dispatch table: concrete argument types -> handler function.
+# Subclass keys resolved by the slow path are memoized up to this size, so classes
+# passed to no(code, exc) are not pinned for the life of the process.
+_DISPATCH_LIMIT = 64
+_DISPATCH: Dict[Tuple[type, ...], Callable[..., None]] = {
+    (list,): _handleExceptionGroup,
+    (int,): _handleSingleCode,
+    (int, str): _handleCodeMessage,
+    (int, BaseException): _handleCodeExceptionLink,
+}
+
+def _resolveHandler(key: Tuple[type, ...]) -> Optional[Callable[..., None]]:
+    """Slow path: match subclasses (bool, ErrorNNN, ...) and memoize under the exact key while below _DISPATCH_LIMIT"""
+    handler: Optional[Callable[..., None]] = None
+    if len(key) == 1:
+        if issubclass(key[0], list):
+            handler = _handleExceptionGroup
+        elif issubclass(key[0], BaseException):
+            handler = _handleRawException
+        elif issubclass(key[0], int):
+            handler = _handleSingleCode
+    elif len(key) == 2 and issubclass(key[0], int):
+        if issubclass(key[1], BaseException):
+            handler = _handleCodeExceptionLink
+        elif issubclass(key[1], str):
+            handler = _handleCodeMessage
+    if handler is not None and len(_DISPATCH) < _DISPATCH_LIMIT:
+        _DISPATCH[key] = handler
+    return handler
 
 def _handleCall(
     context: Union['NoModule', NoBaseException], 
@@ -187,29 +204,32 @@ def _handleCall(
     complaint: Optional[str] = None, 
     soften: bool = False
 ) -> None:
-    """Router for no() calls using strategy pattern"""
-    # Check if this is an empty call with no params
-    if not args and complaint is None and not soften:
+    """Router for no() calls using a type-keyed dispatch table"""
+    # Empty call raises whatever is pending, complaint/soften do not apply
+    if not args:
         return _handleEmptyCall(context, isModule)
-    
-    # Try each handler pattern
-    for pattern_checker, handler in CALL_HANDLERS:
-        if pattern_checker(args):
-            return handler(context, isModule, *args, complaint=complaint, soften=soften)
+
+    key = tuple(map(type, args))
+    handler = _DISPATCH.get(key)
+    if handler is None:
+        handler = _resolveHandler(key)
+
+    # Ordered by call frequency: no(code) dominates
+    if handler is _handleSingleCode:
+        return _handleSingleCode(context, isModule, args[0], complaint, soften)
+    elif handler is _handleCodeMessage:
+        return _handleCodeMessage(context, isModule, args[0], args[1], soften)
+    elif handler is _handleCodeExceptionLink:
+        return _handleCodeExceptionLink(context, isModule, args[0], args[1], complaint, soften)
+    elif handler is _handleExceptionGroup:
+        return _handleExceptionGroup(context, isModule, args[0], complaint)
+    elif handler is _handleRawException:
+        return _handleRawException(context, isModule, args[0])
     
     # No pattern matched - provide helpful error
-    valid_patterns = [
-        "no() - empty call to raise pending exception",
-        "no(code: int) - raise exception with error code",
-        "no([code1, code2, ...]) - raise ExceptionGroup with multiple codes",
-        "no(code: int, complaint: str) - raise with custom message",
-        "no(code: int, exception: BaseException) - link existing exception",
-        "no(exception: BaseException) - noop for raw exceptions"
-    ]
-    raise TypeError(f"Unsupported arguments for no(): {args}\n\nValid patterns:\n" + 
-                   "\n".join(f"  - {pattern}" for pattern in valid_patterns))
-
-def raze(exception: NoBaseException) -> None:
+    raise TypeError(f"Unsupported arguments for no(): {args}\n\n{_VALID_PATTERNS_MSG}")
+
+def raze(exception: NoBaseException) -> NoReturn:
     """Raise the no.way."""
     print(exception)
     sys.exit(1)
\ No newline at end of file
@@ -1,11 +1,26 @@
 from __future__ import annotations
 from typing import Dict, List, Optional, Set, Tuple, overload
-from collections import defaultdict
-import io
-import weakref
+
+# Synthesized "Error {code}" complaints, interned per code (FIFO-capped)
+_DEFAULT_MSG_CACHE: Dict[int, str] = {}
+_DEFAULT_MSG_CACHE_SIZE = 1024
+
+def _defaultMsg(code: int) -> str:
+    """Return the generic complaint for an unregistered code"""
+    msg = _DEFAULT_MSG_CACHE.get(code)
+    if msg is None:
+        msg = f"Error {code}"
+        if len(_DEFAULT_MSG_CACHE) >= _DEFAULT_MSG_CACHE_SIZE:
+            # Evict the oldest entry, dicts keep insertion order
+            try:
+                del _DEFAULT_MSG_CACHE[next(iter(_DEFAULT_MSG_CACHE))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass  # another thread evicted concurrently
+        _DEFAULT_MSG_CACHE[code] = msg
+    return msg
 
 class NoBaseException(Exception):
-    __slots__ = ('nos', '_softCodes', 'linked', '_nos_defaultdict', '_linked_defaultdict')
+    __slots__ = ('nos', '_softCodes', 'linked', '_cached_str', '_code_prefix', '_recyclable')
     nos: Dict[int, List[str]]
     """
     Base class for all exceptions raised by the noexcept module.
@@ -87,7 +102,7 @@ class NoBaseException(Exception):
     ):
         self.nos: Dict[int, List[str]] = {} if codes is None else codes
         if code not in self.nos:
-            self.nos[code] = [defaultComplaint or f"Error {code}"]
+            self.nos[code] = [defaultComplaint or _defaultMsg(code)]
         if complaint:
             self.nos[code].append(complaint)
 
@@ -96,47 +111,79 @@ class NoBaseException(Exception):
             {} if linked is None else linked
         )
 
-        super().__init__(self._composeText())
+        self._cached_str: Optional[str] = None
+        self._code_prefix: Optional[str] = None
+        # Only set by NoModule._makeOne, instances users construct are never pooled
+        self._recyclable = False
+        super().__init__(code)
+
+    def _reset(self, code: int, defaultComplaint: Optional[str], softFlag: bool) -> None:
+        """
+        Reinitialise a recycled instance as a fresh single-code exception.
+        Containers are replaced rather than cleared, callers may still hold the old ones.
+        """
+        self.nos = {code: [defaultComplaint or _defaultMsg(code)]}
+        self._softCodes = {code: softFlag}
+        self.linked = {}
+        self._cached_str = None
+        self._code_prefix = None
+        self.args = (code,)
+        self.__context__ = None
+        self.__cause__ = None
+        self.__suppress_context__ = False
+
+    def __str__(self) -> str:
+        # Compose the text lazily, soft exceptions are often never printed
+        text = self._cached_str
+        if text is None:
+            text = self._cached_str = self._composeText()
+        return text
 
     def _composeText(self) -> str:
-        output = io.StringIO()
-        output.write(f"[{','.join(map(str, self.nos.keys()))}]")
-        for code, msgs in self.nos.items():
-            for msg in msgs:
-                output.write(f"\n{msg}")
-        return output.getvalue()
+        # The "[code,...]" prefix only changes when addCode inserts a new code
+        prefix = self._code_prefix
+        if prefix is None:
+            prefix = self._code_prefix = f"[{','.join(map(str, self.nos))}]"
+        # Fast path for the common single code, single complaint case
+        if len(self.nos) == 1:
+            msgs = next(iter(self.nos.values()))
+            if len(msgs) == 1:
+                return f"{prefix}\n{msgs[0]}"
+        parts = [prefix]
+        parts.extend(msg for msgs in self.nos.values() for msg in msgs)
+        return "\n".join(parts)
 
     def addMessage(self, code: int, complaint: Optional[str]) -> None:
         if complaint:
-            if not hasattr(self, '_nos_defaultdict'):
-                self._nos_defaultdict = defaultdict(list, self.nos)
-            self._nos_defaultdict[code].append(complaint)
-            self.nos = dict(self._nos_defaultdict)
+            msgs = self.nos.get(code)
+            if msgs is None:
+                # A new code changes the "[code,...]" prefix as well
+                self.nos[code] = [complaint]
+                self._code_prefix = None
+            else:
+                msgs.append(complaint)
+            self._cached_str = None
 
     def addCode(self, code: int, defaultComplaint: Optional[str] = None) -> None:
         if code not in self.nos:
-            self.nos[code] = [defaultComplaint or f"Error {code}"]
+            self.nos[code] = [defaultComplaint or _defaultMsg(code)]
+            self._cached_str = None
+            self._code_prefix = None
 
     def _recordLinkedException(self, exception: BaseException) -> None:
-        # Use weak reference to prevent circular references
-        try:
-            weak_exc = weakref.ref(exception)
-            key = (type(exception), str(exception))
-        except TypeError:
-            # Some objects cannot be weakly referenced, fall back to strong reference
-            key = (type(exception), str(exception))
-            
+        # Key on type and text only, the exception object itself is not retained
+        key = (type(exception), str(exception))
         traceback = exception.__traceback__
-        if traceback:
-            while traceback.tb_next:
-                traceback = traceback.tb_next
-            loc = (traceback.tb_frame.f_code.co_filename, traceback.tb_lineno)
-        else:
+        loc: Tuple[Optional[str], Optional[int]]
+        if traceback is None:
             loc = (None, None)
-        if not hasattr(self, '_linked_defaultdict'):
-            self._linked_defaultdict = defaultdict(set, self.linked)
-        self._linked_defaultdict[key].add(loc)
-        self.linked = dict(self._linked_defaultdict)
+        else:
+            nextTb = traceback.tb_next
+            while nextTb is not None:
+                traceback = nextTb
+                nextTb = traceback.tb_next
+            loc = (traceback.tb_frame.f_code.co_filename, traceback.tb_lineno)
+        self.linked.setdefault(key, set()).add(loc)
 
     @overload
     def __call__(self, soften: bool = False) -> None: ...
@@ -157,18 +204,16 @@ class NoBaseException(Exception):
 
 class NoBuilder:
     """Builder pattern for creating complex exceptions with multiple codes and linked exceptions"""
-    
+    __slots__ = ('_codes', '_linked', '_soft_codes')
+
     def __init__(self):
-        self._codes: Dict[int, List[str]] = {}
+        self._codes: List[Tuple[int, Optional[str]]] = []
         self._linked: List[BaseException] = []
         self._soft_codes: Dict[int, bool] = {}
     
     def withCode(self, code: int, complaint: Optional[str] = None) -> 'NoBuilder':
         """Add a code with optional complaint"""
-        if code not in self._codes:
-            self._codes[code] = []
-        if complaint:
-            self._codes[code].append(complaint)
+        self._codes.append((code, complaint))
         return self
     
     def withLinked(self, exception: BaseException) -> 'NoBuilder':
@@ -186,13 +231,8 @@ class NoBuilder:
         if not self._codes:
             raise ValueError("At least one code must be specified")
         
-        # Get the first code as the primary code
-        primary_code = next(iter(self._codes.keys()))
-        primary_complaints = self._codes[primary_code]
-        primary_complaint = primary_complaints[0] if primary_complaints else None
-        
-        # Create the exception
-        exc = NoBaseException(primary_code, primary_complaint, codes=self._codes.copy(), softCodes=self._soft_codes.copy())
+        # The first code is the primary code, its complaints are already folded in
+        exc = NoBaseException(self._codes[0][0], codes=self._foldCodes(), softCodes=self._soft_codes.copy())
         
         # Add linked exceptions
         for linked_exc in self._linked:
@@ -200,31 +240,20 @@ class NoBuilder:
         
         return exc
 
+    def _foldCodes(self) -> Dict[int, List[str]]:
+        """Group the recorded (code, complaint) pairs by code in a single pass"""
+        codes: Dict[int, List[str]] = {}
+        for code, complaint in self._codes:
+            msgs = codes.setdefault(code, [])
+            if complaint:
+                msgs.append(complaint)
+        return codes
+
     def __str__(self) -> str:
-        output = io.StringIO()
-        output.write(f"[{','.join(map(str, self.nos.keys()))}]")
-        
-        for code, msgs in self.nos.items():
-            for msg in msgs:
-                output.write(f"\n{msg}")
-
-        traceback = self.__traceback__
-        if traceback:
-            while traceback.tb_next:
-                traceback = traceback.tb_next
-            output.write(f"\nRaised at {traceback.tb_frame.f_code.co_filename}:{traceback.tb_lineno}")
-
-        if self.__context__ is not None:
-            output.write(f"\ncontext: {type(self.__context__).__name__}: {self.__context__}")
-        if self.__cause__ is not None:
-            output.write(f"\ncause: {type(self.__cause__).__name__}: {self.__cause__}")
-
-        if self.linked:
-            output.write("\nlinked:")
-            for (exceptionType, msg), locations in self.linked.items():
-                locationText = ", ".join(
-                    f"{f}:{ln}" if f else "unknown" for f, ln in sorted(locations)
-                )
-                output.write(f"\n  {exceptionType.__name__}: {msg} @ {locationText}")
-
-        return output.getvalue()
+        codes = self._foldCodes()
+        parts = [f"[{','.join(map(str, codes))}]"]
+        parts.extend(msg for msgs in codes.values() for msg in msgs)
+        if self._linked:
+            parts.append("linked:")
+            parts.extend(f"  {type(exc).__name__}: {exc}" for exc in self._linked)
+        return "\n".join(parts)
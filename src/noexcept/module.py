@@ -1,14 +1,25 @@
 # no.py
 from __future__ import annotations
 import threading
-from typing import Dict, List, Optional, Tuple, Type, Set, overload, Callable, TypeVar, Any, cast
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Set, overload, Callable, TypeVar, Any
 import sys
-from contextlib import contextmanager
-from .exception import NoBaseException, NoBuilder
-from rememory import RMDict, RMBlock, BlockSize
+import random
+from itertools import chain
+from .exception import NoBaseException, NoBuilder, _defaultMsg
+from rememory import RMDict, RMBlock, RMInt, BlockSize
+
+exc_info = sys.exc_info
 
 # Constants
 DEFAULT_BLOCK_SIZE = 4096
+# Defaults for (code, defaultComplaint, linkedCodes, soft) entries passed to likeyMany
+LIKEY_DEFAULTS = (None, "", None, False)
+# Maximum number of recycled exceptions kept per thread
+FREE_LIST_CAP = 64
+# Maximum number of unregistered codes remembered by _lookup
+MISS_CACHE_SIZE = 1024
+# Registry entry used for unregistered codes; an empty complaint falls back to "Error {code}"
+DEFAULT_ENTRY: Tuple[str, str, List[int], bool] = ("NoBaseException", "", [], False)
 
 T = TypeVar("T")
 no: NoModule
@@ -104,18 +115,60 @@ except no.way as noexcept:
 
 See the project README for more examples and the full API reference.
 """
+class _NoThreadLocal(threading.local):
+    """Per-thread state, every thread starts with no pending exception"""
+    def __init__(self):
+        self.pending: Optional[NoBaseException] = None
+        # Diced, never-raised NoBaseException instances ready for reuse
+        self.free: List[NoBaseException] = []
+
+class _GoCtx:
+    """Context manager returned by `no.go(code)`, links & suppresses exceptions under `code`"""
+    __slots__ = ('_m', '_c', '_s')
+
+    def __init__(self, m: NoModule, c: int, s: bool):
+        self._m, self._c, self._s = m, c, s
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, et, ev, tb) -> bool:
+        # Only Exception subclasses are handled, KeyboardInterrupt & co pass through
+        if ev is None or not isinstance(ev, Exception):
+            return False
+        if isinstance(ev, NoBaseException):
+            self._m(self._c, soften=self._s)
+        else:
+            # record & swallow
+            self._m(self._c, ev, soften=self._s)
+        return True
+
 class NoModule:
+    __slots__ = (
+        '_registry', '_registry_view', '_registry_stamp', '_registry_misses',
+        '_lock', '_thread_local', 'pending', 'hideTraceback', 'way', '_excTypes'
+    )
     way: type["NoBaseException"]
-    hideTraceback: bool = False
+    hideTraceback: bool
     pending: RMBlock[Optional["NoBaseException"]]
     
     def __init__(self):
+        self.hideTraceback = False
         self._registry: RMDict[int, Tuple[str, str, List[int], bool]] = RMDict("registry")
+        # In-process snapshot of the shared registry. Readers use it without locking;
+        # writers build a new dict under self._lock and swap the reference in.
+        self._registry_view: Dict[int, Tuple[str, str, List[int], bool]] = dict(self._registry.items())
+        # Rewritten with a fresh random value after every shared registry write. Misses are
+        # remembered with the stamp read before the registry, and trusted only while it holds.
+        self._registry_stamp = RMInt("noregistrystamp")
+        self._registry_misses: Dict[int, int] = {}
         self.pending: RMBlock[Optional[NoBaseException]] = RMBlock("nopending", BlockSize.s4096)  # Using DEFAULT_BLOCK_SIZE equivalent
         self.pending.value = None
         self._lock = threading.Lock()
+        # Generated ErrorNNN subclasses keyed by code
+        self._excTypes: Dict[int, Type[NoBaseException]] = {}
         # Thread-local storage for pending exceptions
-        self._thread_local = threading.local()
+        self._thread_local = _NoThreadLocal()
 
     def go(
         self,
@@ -149,17 +202,7 @@ class NoModule:
                 return None
 
         # Context-manager path
-        @contextmanager
-        def _ctx():
-            try:
-                yield
-            except Exception as exc:
-                if isinstance(exc, NoBaseException):
-                    self(code, soften=soften)
-                else:
-                    # record & swallow
-                    self(code, exc, soften=soften)
-        return _ctx()
+        return _GoCtx(self, code, soften)
     
     def dice(self) -> None:
         """
@@ -175,9 +218,18 @@ class NoModule:
         of soft exceptions.
         """
         self.pending.value = None
-        # Clear thread-local pending as well
-        if hasattr(self._thread_local, 'pending'):
-            self._thread_local.pending = None
+        # Clear thread-local pending as well, recycling it if _makeOne created it
+        # and it never escaped via raise
+        local = self._thread_local
+        pending = local.pending
+        if (
+            pending is not None
+            and getattr(pending, '_recyclable', False)
+            and pending.__traceback__ is None
+            and len(local.free) < FREE_LIST_CAP
+        ):
+            local.free.append(pending)
+        local.pending = None
         
     def traceback(self) -> None:
         """
@@ -192,14 +244,17 @@ class NoModule:
         """
         self.hideTraceback = True
 
+    def _currentPending(self) -> Optional[NoBaseException]:
+        """The pending exception for this thread, falling back to the global one"""
+        p = self._thread_local.pending
+        return p if p is not None else self.pending.value
+
     @property
     def bueno(self) -> bool:
         """
         Returns true if there is a pending or an active no.way
         """
-        # Check thread-local pending first, then global pending
-        return (getattr(self._thread_local, 'pending', None) is not None or 
-                self.pending.value is not None)
+        return self._currentPending() is not None
 
     @property
     def complaints(self) -> list[str]:
@@ -209,11 +264,10 @@ class NoModule:
         return that exception's messages.  Failing both, return an empty list.
         """
         # 1) Check thread-local first, then global pending
-        stash = getattr(self._thread_local, 'pending', None) or self.pending.value
+        stash = self._currentPending()
         if stash is None:
             # 2) Fallback to currently-caught NoBaseException
-            import sys
-            _, baseException, _ = sys.exc_info()
+            _, baseException, _ = exc_info()
             if isinstance(baseException, NoBaseException):
                 stash = baseException
 
@@ -221,10 +275,7 @@ class NoModule:
             return []
 
         # Flatten all the per-code message lists
-        msgs: list[str] = []
-        for m_list in stash.nos.values():
-            msgs.extend(m_list)
-        return msgs
+        return list(chain.from_iterable(stash.nos.values()))
     
     @property
     def nos(self) -> Dict[int, List[str]]:
@@ -234,13 +285,12 @@ class NoModule:
         return that exception's codes.  Failing both, return an empty dict.
         """
         # 1) Check thread-local first, then global pending
-        stash = getattr(self._thread_local, 'pending', None) or self.pending.value
+        stash = self._currentPending()
         if stash is not None:
-            return cast(NoBaseException, stash).nos
+            return stash.nos
 
         # 2) Fallback to the currently caught NoBaseException
-        import sys
-        _, noBaseError, _ = sys.exc_info()
+        _, noBaseError, _ = exc_info()
         if isinstance(noBaseError, NoBaseException):
             return noBaseError.nos
 
@@ -329,25 +379,94 @@ class NoModule:
         raise no.Error500("Custom override complaint")
         ```
         """
-        # Prepare data outside the lock to minimize lock time
-        name = f"Error{code}"
-        excType = type(name, (NoBaseException,), {})
-        registry_entry = (
-            name,
-            defaultComplaint or f"Error {code}",
-            linkedCodes or [],
-            soft
-        )
-        
-        # Critical section - minimize time holding lock
+        # Already registered in this process: no lock needed, the view is swapped atomically
+        if code in self._registry_view:
+            return
+        self.likeyMany(((code, defaultComplaint, linkedCodes, soft),))
+
+    def likeyMany(self, entries: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Register many error codes at once, taking the lock a single time.
+
+        Each entry follows the `likey` argument order,
+        `(code, defaultComplaint, linkedCodes, soft)`, and trailing fields may be
+        omitted. Codes that are already registered are skipped.
+
+        Example
+        -------
+        ```python
+        no.likeyMany([
+            (404, "Not Found"),
+            (500, "Server Error", [404]),
+            (1001, "Minor warning", None, True),
+        ])
+        ```
+        """
+        # Prepare types and registry entries outside the lock, skipping codes this
+        # process already knows about without taking the lock
+        view = self._registry_view
+        prepared = []
+        for entry in entries:
+            entry = tuple(entry)
+            code, defaultComplaint, linkedCodes, soft = entry + LIKEY_DEFAULTS[len(entry):]
+            if code in view:
+                continue
+            name = f"Error{code}"
+            prepared.append((
+                code,
+                name,
+                type(name, (NoBaseException,), {}),
+                (name, defaultComplaint or _defaultMsg(code), linkedCodes or [], soft)
+            ))
+
+        if not prepared:
+            return
+
+        # Critical section - re-check the shared registry, then write and publish once
         with self._lock:
-            # Check if already registered to avoid duplicates
-            if code in self._registry:
-                return
-            
-            setattr(self, name, excType)
-            setattr(sys.modules[__name__], name, excType)
-            self._registry[code] = registry_entry
+            registered = set(self._registry)
+            newEntries: Dict[int, Tuple[str, str, List[int], bool]] = {}
+            for code, name, excType, registry_entry in prepared:
+                if code in registered or code in newEntries:
+                    continue
+                setattr(sys.modules[__name__], name, excType)
+                self._excTypes[code] = excType
+                newEntries[code] = registry_entry
+            if newEntries:
+                self._registry.update(newEntries)
+                self._registry_stamp.value = random.getrandbits(63)
+                self._publish(newEntries)
+
+    def _publish(self, entries: Dict[int, Tuple[str, str, List[int], bool]]) -> None:
+        """Swap in a registry view that includes `entries`. Caller must hold self._lock."""
+        view = dict(self._registry_view)
+        view.update(entries)
+        self._registry_view = view
+
+    def _lookup(self, code: int) -> Optional[Tuple[str, str, List[int], bool]]:
+        """
+        Lock-free registry read against the in-process view. On a miss the view is
+        rebuilt from the shared registry in one read, picking up every code that
+        other processes registered since the last sync. Codes that are still missing
+        are remembered until the registry stamp changes.
+        """
+        entry = self._registry_view.get(code)
+        if entry is None:
+            stamp = self._registry_stamp.value
+            misses = self._registry_misses
+            if misses.get(code) == stamp:
+                return None
+            shared = dict(self._registry.items())
+            entry = shared.get(code)
+            if entry is not None:
+                with self._lock:
+                    shared.update(self._registry_view)
+                    self._registry_view = shared
+            else:
+                if len(misses) >= MISS_CACHE_SIZE:
+                    misses.clear()
+                misses[code] = stamp
+        return entry
 
     @overload
     def __call__(self, soften: bool = False) -> None: ...
@@ -362,38 +481,70 @@ class NoModule:
     @overload
     def __call__(self, codes: List[int], *, complaint: str = "", linked: Optional[List[BaseException]] = None, soften: bool = False) -> None: ...
 
-    def __call__(self, *args, **kwargs) -> None:
-        from .call import _handleCall
-        return _handleCall(self, True, *args, **kwargs)
+    def __call__(self, *args: Any, complaint: Optional[str] = None, soften: bool = False, **kwargs: Any) -> None:
+        # Fast path for the dominant no(code) form, skipping the argument router
+        if len(args) == 1 and type(args[0]) is int and not kwargs:
+            return _handleSingleCode(self, True, args[0], complaint, soften)
+        return _handleCall(self, True, *args, complaint=complaint, soften=soften, **kwargs)
+
+    def _remoteType(self, code: int, excName: str) -> Type[NoBaseException]:
+        """Build (once) the subclass for a code that another process registered"""
+        excType = getattr(sys.modules[__name__], excName, None)
+        if excType is None:
+            excType = type(excName, (NoBaseException,), {})
+            setattr(sys.modules[__name__], excName, excType)
+        self._excTypes[code] = excType
+        return excType
+
+    def __getattr__(self, name: str) -> Type[NoBaseException]:
+        """Resolve `no.Error404` style attributes from the generated exception types"""
+        if name.startswith("Error") and name[5:].isdigit():
+            code = int(name[5:])
+            excType = self._excTypes.get(code)
+            if excType is not None:
+                return excType
+            entry = self._lookup(code)
+            if entry is not None:
+                return self._remoteType(code, entry[0])
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     def _makeOne(
         self,
         code: int,
         complaint: Optional[str],
-        linked: Optional[List[BaseException]]
+        linked: Optional[List[BaseException]],
+        entry: Optional[Tuple[str, str, List[int], bool]] = None
     ) -> NoBaseException:
-        with self._lock:
-            excName, defaultMsg, linkedCodes, softFlag = self._registry.get(
-                code, ("NoBaseException", f"Error {code}", [], False)
-            )
-
-        if excName == "NoBaseException":
-            excType = NoBaseException
-        else:
-            excType = getattr(sys.modules[__name__], excName, None)
-            if excType is None:
-                excType = type(excName, (NoBaseException,), {})
-                setattr(sys.modules[__name__], excName, excType)
-                setattr(self, excName, excType)
+        # Callers that already looked the code up pass the entry to skip a second lookup
+        if entry is None:
+            entry = self._lookup(code) or DEFAULT_ENTRY
+        excName, defaultMsg, linkedCodes, softFlag = entry
+
+        excType = self._excTypes.get(code)
+        if excType is None:
+            if excName == "NoBaseException":
+                excType = NoBaseException
+            else:
+                excType = self._remoteType(code, excName)
+
+        if excType is NoBaseException and not complaint and not linked and not linkedCodes:
+            free = self._thread_local.free
+            if free:
+                exc = free.pop()
+                exc._reset(code, defaultMsg, softFlag)
+                return exc
 
         softCodes = {code: softFlag}
         exc = excType(code, complaint, defaultComplaint=defaultMsg, linked={}, softCodes=softCodes)
+        if excType is NoBaseException:
+            # Created and owned here, so dice() may recycle it if it never gets raised
+            exc._recyclable = True
         if linked:
             for l in linked:
                 exc._recordLinkedException(l)
+        lookup = self._lookup
         for extra in linkedCodes:
-            msg = self._registry.get(extra, (None, f"Error {extra}", [], False))[1]
-            extraSoft = self._registry.get(extra, (None, "", [], False))[3]
+            _, msg, _, extraSoft = lookup(extra) or DEFAULT_ENTRY
             exc.addCode(extra, msg)
             exc._softCodes[extra] = extraSoft
         return exc
@@ -412,8 +563,7 @@ class NoModule:
         newCode : int
             The error code to add
         """
-        msg = self._registry.get(newCode, (None, f"Error {newCode}", [], False))[1]
-        soft = self._registry.get(newCode, (None, "", [], False))[3]
+        _, msg, _, soft = self._lookup(newCode) or DEFAULT_ENTRY
         exc.addCode(newCode, msg)
         exc._softCodes[newCode] = soft
 
@@ -437,4 +587,7 @@ class NoModule:
 no = NoModule()
 no.way = NoBaseException
 
+# Bound after `no` exists, call.py imports it back from this module
+from .call import _handleCall, _handleSingleCode
+
 __all__ = ["no"]
\ No newline at end of file
@@ -33,6 +33,28 @@ def testPropagation():
         no(500, soften=True)
         assert 404 in noexcept.nos and 500 in noexcept.nos
 
+def testLinkingWay():
+    no.dice()
+    try:
+        try:
+            no(404)
+        except no.way as noexcept:
+            no(500, noexcept)
+    except no.Error500 as wrapped:
+        assert 500 in wrapped.nos and 404 not in wrapped.nos
+        assert any("Error404" in str(linked) for linked in wrapped.linked)
+
+def testInstanceSoften():
+    no.dice()
+    try:
+        no(404)
+    except no.way as noexcept:
+        noexcept(500, soften=True)
+        assert no._thread_local.pending is noexcept
+        noexcept(501, "Soft complaint", soften=True)
+        assert no._thread_local.pending is noexcept
+        assert 500 in noexcept.nos and 501 in noexcept.nos
+
 def testLinking():
     try:
         raise ValueError("bad")
@@ -109,6 +131,72 @@ def testGoContextManager():
         raise KeyError("ctx error")
     assert 802 in no.nos
 
+def testRecycling():
+    no.dice()
+
+    # a diced soft exception that no() created is reused for the next one
+    no(9001, soften=True)
+    first = no._thread_local.pending
+    firstNos = no.nos
+    no.dice()
+    no(9002, soften=True)
+    assert no._thread_local.pending is first
+    assert no.nos == {9002: ["Error 9002"]}
+    assert firstNos == {9001: ["Error 9001"]}
+    no.dice()
+
+    # exceptions the caller built and still holds are never recycled
+    mine = no.build().withCode(7, "mine").build()
+    mine(8, soften=True)
+    no.dice()
+    try:
+        no(99999)
+    except no.way as fresh:
+        assert fresh is not mine
+    assert mine.nos == {7: ["mine"], 8: ["Error 8"]}
+    no.dice()
+
+def testPrefixCache():
+    no.dice()
+
+    # codes accumulated onto a pending exception show up in a cached prefix
+    no(9101, soften=True)
+    pending = no._thread_local.pending
+    assert str(pending).startswith("[9101]\n")
+    no(9102, "Second complaint")
+    assert pending is no._thread_local.pending
+    s = str(pending)
+    assert s.startswith("[9101,9102]\n") and "Second complaint" in s
+    no.dice()
+
+    # addCode refreshes the prefix after str() has cached it
+    exc = no.build().withCode(9103, "Only complaint").build()
+    assert str(exc) == "[9103]\nOnly complaint"
+    exc.addCode(9104, "Added complaint")
+    assert str(exc) == "[9103,9104]\nOnly complaint\nAdded complaint"
+    exc.addCode(9104, "Ignored duplicate")
+    assert str(exc) == "[9103,9104]\nOnly complaint\nAdded complaint"
+
+def testBuilder():
+    builder = (no.build()
+        .withCode(9201, "First")
+        .withCode(9202, "Second")
+        .withCode(9201, "Again")
+        .withLinked(ValueError("bad value"))
+        .asSoft(9202))
+
+    # every build() folds the same codes into an independent exception
+    first = builder.build()
+    second = builder.build()
+    assert first.nos == second.nos == {9201: ["First", "Again"], 9202: ["Second"]}
+    assert first.nos is not second.nos
+    assert first._softCodes == second._softCodes == {9202: True}
+    assert first.linked == second.linked
+    first.addMessage(9202, "Only on first")
+    assert second.nos[9202] == ["Second"]
+
+    assert str(builder) == "[9201,9202]\nFirst\nAgain\nSecond\nlinked:\n  ValueError: bad value"
+
 def cryNowRaiseLater():
     try:
         thereIsNoTry()  # type: ignore[no-untyped-call]
@@ -141,10 +229,23 @@ def worker(code):
     # each process registers its own code
     no.likey(code, f"Process-msg {code}")
 
+def testLikeyMany():
+    codes = list(range(3000, 3010))
+    no.likeyMany((c, f"Bulk-msg {c}") for c in codes)
+    no.likeyMany([(3010, "Bulk soft", None, True)])
+
+    registry = no._registry
+    for c in codes:
+        assert c in registry, f"Code {c} missing from registry"
+    assert registry[3010][3] is True
+
 def testMultiProcessingSafety():
     print("Testing multiprocessing safety...")
     # Pick a batch of distinct codes
     codes = list(range(2000, 2010))
+
+    # A miss remembered before the other processes register must not stick
+    no._lookup(codes[0])
     
     # Spawn processes
     processes = [Process(target=worker, args=(c,)) for c in codes]
@@ -157,6 +258,7 @@ def testMultiProcessingSafety():
     registry = no._registry
     for c in codes:
         assert c in registry, f"Code {c} missing from registry"
+        assert no._lookup(c) is not None, f"Code {c} missing from registry view"
 
 def main():
     print("Running no-exceptions self-test...")
@@ -180,6 +282,8 @@ def main():
     record("Module Import", testImportNo)
     record("Soft Code Call", testSoftCode)
     record("Adding Codes", testPropagation)
+    record("Linking no.way", testLinkingWay)
+    record("Softened Instance Call", testInstanceSoften)
     record("Linking Exception", testLinking)
     record("Exception Groups", testExceptionGroup)
     record("Output", testStrOutput)
@@ -188,8 +292,12 @@ def main():
     record("Cry Now, Raise Later", testCryNowRaiseLater)
     record("Go Callable", testGoCallable)
     record("Go Context Manager", testGoContextManager)
+    record("Recycling Soft Exceptions", testRecycling)
+    record("Prefix Cache", testPrefixCache)
+    record("Builder", testBuilder)
     record("Thread Safety", testThreadSafety)
     record("Multi-Processing Safety", testMultiProcessingSafety)
+    record("Bulk Registration", testLikeyMany)
 
     print("Final no.bueno Test", no.bueno)
 